@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Configuration Package
+Centralized configuration for the Password Cracking Suite
+
+This package exposes all configurable settings for the application
+as attributes (config.MAX_WORKERS). The default values are defined in
+config/constants.py; modify them there to customize the behavior of
+the toolkit. Helper functions live in config/helpers.py and are only
+imported when first used.
+
+Usage:
+    python3 -m config            # Print current configuration
+"""
+
+import sys
+from types import ModuleType
+
+from . import constants as _constants
+
+
+# ==================== SETTINGS ====================
+
+# All UPPERCASE settings from config.constants are copied into this
+# module's namespace, so reading config.MAX_WORKERS is a plain attribute
+# lookup. The module's class is swapped for _ConfigModule so that writes
+# (config.MAX_WORKERS = ...) go through set_config_value().
+_SETTING_NAMES = tuple(
+    key for key in vars(_constants) if key.isupper() and not key.startswith('_')
+)
+
+globals().update((key, getattr(_constants, key)) for key in _SETTING_NAMES)
+
+
+# Helper functions resolved from config.helpers on first access
+_LAZY_HELPERS = (
+    'ensure_output_dirs', 'get_log_formatter', 'maybe_seed_word',
+    'base_dir_resolved', 'get_disclaimer_text', 'get_default_config',
+    'get_config_value', 'set_config_value', 'validate_custom_config',
+    'load_custom_config', 'print_config', 'snapshot_settings',
+    'restore_settings',
+)
+
+# Computed values kept available under their old setting names
+_LAZY_VALUES = {
+    'DISCLAIMER_TEXT': 'get_disclaimer_text',
+    'DEFAULT_FORMATTER': 'get_log_formatter',
+}
+
+
+# PEP 562 hook, only called for names missing from the module namespace,
+# so setting reads never get here
+def __getattr__(name):
+    if name in _LAZY_HELPERS:
+        from . import helpers
+        return getattr(helpers, name)
+    if name in _LAZY_VALUES:
+        from . import helpers
+        return getattr(helpers, _LAZY_VALUES[name])()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_HELPERS))
+
+
+class _ConfigModule(ModuleType):
+    """Module type that sends setting writes through set_config_value()"""
+    
+    # Only __setattr__ is overridden: attribute reads keep using the
+    # plain module lookup
+    def __setattr__(self, name, value):
+        if name in _SETTING_NAMES:
+            from .helpers import set_config_value
+            set_config_value(name, value)
+        else:
+            super().__setattr__(name, value)
+
+
+__all__ = _SETTING_NAMES + _LAZY_HELPERS
+
+sys.modules[__name__].__class__ = _ConfigModule
@@ -0,0 +1,6 @@
+#!/usr/bin/env python3
+"""Print the current configuration: python3 -m config"""
+
+import config
+
+config.print_config()
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Configuration Constants
+Default settings for the Password Cracking Suite
+
+This module holds only the setting values (and the small builders for
+the derived lookup tables), with no I/O, so it can be byte-compiled
+ahead of time (see tools/freeze_config.py).
+Modify these values to customize the behavior of the toolkit.
+
+Application code should read settings through the config module
+(config.MAX_WORKERS), which also supports overriding them at runtime.
+"""
+
+import os
+import zlib
+from array import array
+from pathlib import Path
+from types import MappingProxyType
+
+# ==================== PROJECT PATHS ====================
+# Base directory of the project
+# (module __file__ is already absolute; symlinks are not resolved here,
+# use base_dir_resolved() where the real path matters)
+BASE_DIR = Path(__file__).parent.parent
+
+# Output directories
+OUTPUT_DIR = BASE_DIR / 'output'
+WORDLIST_DIR = OUTPUT_DIR / 'wordlists'
+CRACKED_DIR = OUTPUT_DIR / 'cracked'
+REPORTS_DIR = OUTPUT_DIR / 'reports'
+LOGS_DIR = OUTPUT_DIR / 'logs'
+
+# Sample files directory
+SAMPLES_DIR = BASE_DIR / 'samples'
+
+# Output directories are created on demand by ensure_output_dirs()
+
+
+# ==================== DICTIONARY GENERATION SETTINGS ====================
+
+# Default year range for date patterns
+DEFAULT_START_YEAR = 1990
+DEFAULT_END_YEAR = 2024
+
+# Maximum number of words to generate (0 = unlimited)
+MAX_WORDLIST_SIZE = 100000
+
+# Default base words if none provided
+# The *_ORDERED tuples keep the original order for output; the frozensets
+# give O(1) membership checks. set_config_value() updates both forms when
+# either one is set.
+DEFAULT_BASE_WORDS_ORDERED = ('password', 'admin', 'user', 'test')
+DEFAULT_BASE_WORDS = frozenset(DEFAULT_BASE_WORDS_ORDERED)
+
+# Common passwords to include
+COMMON_PASSWORDS_ORDERED = (
+    "password", "123456", "password123", "admin", "letmein",
+    "welcome", "monkey", "dragon", "master", "sunshine",
+    "princess", "qwerty", "abc123", "111111", "iloveyou",
+    "admin123", "password1", "12345678", "123456789", "1234567890"
+)
+COMMON_PASSWORDS = frozenset(COMMON_PASSWORDS_ORDERED)
+
+# Keyboard patterns to include
+KEYBOARD_PATTERNS_ORDERED = (
+    "qwerty", "qwertyuiop", "asdfgh", "asdfghjkl", "zxcvbn",
+    "1qaz2wsx", "qazwsx", "123qwe", "1q2w3e4r", "qweasd",
+    "!qaz@wsx", "1234", "12345", "123456", "1234567", "12345678"
+)
+KEYBOARD_PATTERNS = frozenset(KEYBOARD_PATTERNS_ORDERED)
+
+# All seed words (common passwords, keyboard patterns, default base words)
+# deduplicated and sorted, for bisect lookups, plus the same words as one
+# newline-separated bytes blob. The SEED_* values are derived from the word
+# lists and rebuilt by set_config_value() when one of them changes.
+def _build_seed_words(*word_sets):
+    return tuple(sorted(frozenset().union(*word_sets)))
+
+
+def _build_seed_blob(words):
+    return b'\n'.join(word.encode('utf-8') for word in words)
+
+
+SEED_WORDS = _build_seed_words(COMMON_PASSWORDS, KEYBOARD_PATTERNS, DEFAULT_BASE_WORDS)
+SEED_BLOB = _build_seed_blob(SEED_WORDS)
+
+# Bloom filter over SEED_WORDS: a zero bit at any of a word's positions
+# means the word is definitely not a seed word
+SEED_BLOOM_BITS = 1024
+SEED_BLOOM_HASHES = 3
+
+
+def _bloom_positions(word, bits=SEED_BLOOM_BITS, k=SEED_BLOOM_HASHES):
+    # Double hashing (h1 + i*h2) with two fast checksums from zlib
+    data = word.encode('utf-8')
+    h1 = zlib.crc32(data)
+    h2 = zlib.adler32(data) | 1
+    return [(h1 + i * h2) % bits for i in range(k)]
+
+
+def _build_bloom(words, bits=SEED_BLOOM_BITS, k=SEED_BLOOM_HASHES):
+    bloom = bytearray((bits + 7) // 8)
+    for word in words:
+        for pos in _bloom_positions(word, bits, k):
+            bloom[pos >> 3] |= 1 << (pos & 7)
+    return bytes(bloom)
+
+
+SEED_BLOOM = _build_bloom(SEED_WORDS)
+
+# Leet-speak character mappings
+LEET_SPEAK_MAP = {
+    'a': ['a', '@', '4'],
+    'e': ['e', '3'],
+    'i': ['i', '1', '!'],
+    'o': ['o', '0'],
+    's': ['s', '$', '5'],
+    't': ['t', '7'],
+    'l': ['l', '1'],
+    'g': ['g', '9'],
+    'b': ['b', '8']
+}
+
+# Flattened (structure-of-arrays) form of LEET_SPEAK_MAP for byte-level mutators.
+# The variants for byte value b live in LEET_PAYLOAD[LEET_OFFSETS[b]:LEET_OFFSETS[b + 1]]
+# and LEET_INDEX[b] holds their count (0 = character has no substitutions).
+# Substitutions must be single ASCII characters.
+# These and the other LEET_* tables below are derived from LEET_SPEAK_MAP and
+# rebuilt by set_config_value() whenever the map is replaced.
+def _build_leet_tables(leet_map):
+    counts = bytearray(256)
+    payload = bytearray()
+    offsets = array('I', [0]) * 257
+    for char, replacements in leet_map.items():
+        if not (len(char) == 1 and char.isascii()
+                and all(len(r) == 1 and r.isascii() for r in replacements)):
+            raise ValueError(
+                f"leet substitutions for {char!r} must be single ASCII characters"
+            )
+        counts[ord(char)] = len(replacements)
+    for b in range(256):
+        offsets[b] = len(payload)
+        if counts[b]:
+            payload += ''.join(leet_map[chr(b)]).encode('ascii')
+    offsets[256] = len(payload)
+    return bytes(counts), offsets, bytes(payload)
+
+
+def _build_leet_choices(index, offsets, payload):
+    return tuple(
+        payload[offsets[b]:offsets[b + 1]].decode('ascii') if index[b] else chr(b)
+        for b in range(256)
+    )
+
+
+def _build_leet_substitutions(leet_map):
+    return tuple(
+        (char, replacement)
+        for char, replacements in leet_map.items()
+        for replacement in replacements[1:]
+    )
+
+
+LEET_INDEX, LEET_OFFSETS, LEET_PAYLOAD = _build_leet_tables(LEET_SPEAK_MAP)
+
+# Per-character choice strings for full leet expansion: LEET_CHOICES[ord(c)]
+# is every character that may stand in position c (c itself if unmapped)
+LEET_CHOICES = _build_leet_choices(LEET_INDEX, LEET_OFFSETS, LEET_PAYLOAD)
+
+# (character, replacement) pairs for single-substitution leet variants, in
+# LEET_SPEAK_MAP order with each character's own identity entry left out
+LEET_SUBSTITUTIONS = _build_leet_substitutions(LEET_SPEAK_MAP)
+
+# Special characters for mutations
+SPECIAL_CHARACTERS = ['!', '@', '#', '$', '%', '&', '*', '?']
+
+
+# ==================== HASH EXTRACTION SETTINGS ====================
+
+# Supported hash algorithms
+SUPPORTED_HASH_ALGORITHMS = [
+    'MD5',          # $1$
+    'SHA-256',      # $5$
+    'SHA-512',      # $6$
+    'NTLM',         # Windows
+    'bcrypt',       # $2a$, $2b$, $2y$
+]
+
+# Linux shadow file default path (for reference only)
+LINUX_SHADOW_PATH = '/etc/shadow'
+
+# Windows SAM registry paths (for reference only)
+WINDOWS_SAM_PATH = r'C:\Windows\System32\config\SAM'
+WINDOWS_SYSTEM_PATH = r'C:\Windows\System32\config\SYSTEM'
+
+
+# ==================== BRUTE-FORCE SETTINGS ====================
+
+# Character sets for brute-force attacks
+CHARSET_LOWERCASE = 'abcdefghijklmnopqrstuvwxyz'
+CHARSET_UPPERCASE = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+CHARSET_DIGITS = '0123456789'
+CHARSET_SPECIAL = '!@#$%^&*()_+-=[]{}|;:,.<>?'
+
+# Default character set combinations
+CHARSET_ALPHA = CHARSET_LOWERCASE + CHARSET_UPPERCASE
+CHARSET_ALPHANUMERIC = CHARSET_ALPHA + CHARSET_DIGITS
+CHARSET_ALL = CHARSET_ALPHANUMERIC + CHARSET_SPECIAL
+
+# Pre-encoded character sets, so candidate generation can index bytes
+# directly instead of encoding every attempt before hashing
+# (rebuilt by set_config_value() when a character set changes)
+CHARSET_LOWERCASE_BYTES = CHARSET_LOWERCASE.encode('ascii')
+CHARSET_UPPERCASE_BYTES = CHARSET_UPPERCASE.encode('ascii')
+CHARSET_DIGITS_BYTES = CHARSET_DIGITS.encode('ascii')
+CHARSET_SPECIAL_BYTES = CHARSET_SPECIAL.encode('ascii')
+CHARSET_ALPHA_BYTES = CHARSET_ALPHA.encode('ascii')
+CHARSET_ALPHANUMERIC_BYTES = CHARSET_ALPHANUMERIC.encode('ascii')
+CHARSET_ALL_BYTES = CHARSET_ALL.encode('ascii')
+
+# Password length constraints
+MIN_PASSWORD_LENGTH = 1
+MAX_PASSWORD_LENGTH = 12  # Increase with caution - exponential growth!
+
+# Number of candidates per password length: KEYSPACE_X[length] == len(CHARSET_X) ** length
+# (computed for lengths 0..MAX_PASSWORD_LENGTH, and rebuilt by set_config_value()
+# when a character set or MAX_PASSWORD_LENGTH changes)
+def _build_keyspace(charset, max_length):
+    return tuple(len(charset) ** n for n in range(max_length + 1))
+
+
+KEYSPACE_LOWERCASE = _build_keyspace(CHARSET_LOWERCASE, MAX_PASSWORD_LENGTH)
+KEYSPACE_UPPERCASE = _build_keyspace(CHARSET_UPPERCASE, MAX_PASSWORD_LENGTH)
+KEYSPACE_DIGITS = _build_keyspace(CHARSET_DIGITS, MAX_PASSWORD_LENGTH)
+KEYSPACE_SPECIAL = _build_keyspace(CHARSET_SPECIAL, MAX_PASSWORD_LENGTH)
+KEYSPACE_ALPHA = _build_keyspace(CHARSET_ALPHA, MAX_PASSWORD_LENGTH)
+KEYSPACE_ALPHANUMERIC = _build_keyspace(CHARSET_ALPHANUMERIC, MAX_PASSWORD_LENGTH)
+KEYSPACE_ALL = _build_keyspace(CHARSET_ALL, MAX_PASSWORD_LENGTH)
+
+# Attack timeout (seconds)
+ATTACK_TIMEOUT = 3600  # 1 hour
+
+# Maximum attempts before timeout warning
+MAX_ATTEMPTS_WARNING = 1000000
+
+
+# ==================== PASSWORD STRENGTH ANALYZER SETTINGS ====================
+
+# Complexity requirements (for scoring)
+MIN_LENGTH_WEAK = 8
+MIN_LENGTH_MEDIUM = 12
+MIN_LENGTH_STRONG = 16
+
+# Entropy thresholds (bits)
+ENTROPY_WEAK = 28      # < 28 bits = weak
+ENTROPY_MEDIUM = 36    # 28-36 bits = medium
+ENTROPY_STRONG = 60    # 36-60 bits = strong
+ENTROPY_VERY_STRONG = 128  # > 60 bits = very strong
+
+# Character class requirements
+REQUIRE_UPPERCASE = True
+REQUIRE_LOWERCASE = True
+REQUIRE_DIGITS = True
+REQUIRE_SPECIAL = True
+
+# Common password lists to check against
+COMMON_PASSWORDS_FILE = SAMPLES_DIR / 'common_passwords.txt'
+
+
+# ==================== REPORT GENERATION SETTINGS ====================
+
+# Report format
+DEFAULT_REPORT_FORMAT = 'txt'  # Options: 'txt', 'json', 'html', 'pdf'
+
+# Report sections to include
+INCLUDE_EXECUTIVE_SUMMARY = True
+INCLUDE_DETAILED_FINDINGS = True
+INCLUDE_STATISTICS = True
+INCLUDE_RECOMMENDATIONS = True
+INCLUDE_METHODOLOGY = True
+
+# Report templates
+REPORT_TEMPLATE_DIR = BASE_DIR / 'reports' / 'templates'
+
+
+# ==================== LOGGING SETTINGS ====================
+
+# Logging level
+# Options: 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'
+LOG_LEVEL = 'INFO'
+
+# Log file name
+LOG_FILE = LOGS_DIR / 'password_cracking_suite.log'
+
+# Log format
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Console output
+VERBOSE_OUTPUT = True
+SHOW_PROGRESS_BAR = True
+
+
+# ==================== PERFORMANCE SETTINGS ====================
+
+# Multi-threading settings
+USE_MULTIPROCESSING = True
+# Number of parallel processes: PWC_MAX_WORKERS environment variable,
+# otherwise one per CPU. os.cpu_count() is used on purpose - importing
+# multiprocessing just to read the core count would slow down startup.
+def _env_workers(name, default):
+    # A bad value must not stop the config from importing, since every
+    # entry point (--help included) imports it; fall back to the default
+    try:
+        workers = int(os.environ.get(name) or default)
+    except ValueError:
+        workers = default
+    return max(1, workers)
+
+
+MAX_WORKERS = _env_workers('PWC_MAX_WORKERS', os.cpu_count() or 4)
+
+# Memory management
+MAX_MEMORY_MB = 2048  # Maximum memory usage in MB
+
+# Batch processing
+BATCH_SIZE = 1000  # Process passwords in batches
+
+
+# ==================== SECURITY SETTINGS ====================
+
+# Ethical use disclaimer
+REQUIRE_DISCLAIMER_ACCEPTANCE = True
+
+# Disclaimer text (read on demand via get_disclaimer_text())
+DISCLAIMER_FILE = SAMPLES_DIR / 'disclaimer.txt'
+
+# Sensitive data handling
+CLEAR_MEMORY_ON_EXIT = True
+ENCRYPT_STORED_RESULTS = False  # Future feature
+
+
+# ==================== APPLICATION SETTINGS ====================
+
+# Application metadata
+APP_NAME = "Password Cracking & Credential Attack Suite"
+APP_VERSION = "1.0.0"
+APP_AUTHOR = "Security Research Team"
+APP_DESCRIPTION = "Educational toolkit for password policy testing and security assessment"
+
+# Default configuration for new users
+# Shared read-only structure; use get_default_config() for an editable copy.
+# File locations are kept as Path objects and only turned into strings
+# when a caller needs JSON (see get_default_config(json_safe=True)).
+def _freeze(obj):
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+
+DEFAULT_CONFIG = _freeze({
+    'dictionary': {
+        'base_words': DEFAULT_BASE_WORDS_ORDERED,
+        'use_dates': True,
+        'start_year': DEFAULT_START_YEAR,
+        'end_year': DEFAULT_END_YEAR,
+        'use_common': True,
+        'use_keyboard': True,
+        'mutations': {
+            'leetspeak': True,
+            'uppercase': True,
+            'numbers': True,
+            'special': False
+        },
+        'output_file': WORDLIST_DIR / 'wordlist.txt',
+        'max_words': MAX_WORDLIST_SIZE
+    },
+    'hash_extraction': {
+        'enabled': False,
+        'hash_type': 'linux_shadow',
+        'hash_source': '',
+        'output_file': CRACKED_DIR / 'extracted_hashes.txt'
+    },
+    'attack_simulation': {
+        'mode': 'dictionary',
+        'hash_file': '',
+        'dictionary_file': WORDLIST_DIR / 'wordlist.txt',
+        'charset': CHARSET_ALPHANUMERIC,
+        'min_length': MIN_PASSWORD_LENGTH,
+        'max_length': 8,
+        'output_file': CRACKED_DIR / 'cracked.txt'
+    },
+    'analysis': {
+        'enabled': True,
+        'input_type': 'file',
+        'source': '',
+        'check_complexity': True,
+        'calculate_entropy': True,
+        'check_dictionary': True,
+        'report_file': REPORTS_DIR / 'analysis_report.txt'
+    }
+})
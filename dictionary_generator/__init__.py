@@ -3,10 +3,24 @@ Dictionary Generator Module
 
 This module provides functionality for generating custom password dictionaries
 based on various patterns, mutations, and user-provided inputs.
-"""
 
-from .generator import DictionaryGenerator
-from .patterns import PatternGenerator
+The generator classes are imported on first access, so reading
+__version__ does not load them.
+"""
 
 __all__ = ['DictionaryGenerator', 'PatternGenerator']
 __version__ = '1.0.0'
+
+
+def __getattr__(name):
+    if name == 'DictionaryGenerator':
+        from .generator import DictionaryGenerator
+        return DictionaryGenerator
+    if name == 'PatternGenerator':
+        from .patterns import PatternGenerator
+        return PatternGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
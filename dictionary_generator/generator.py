@@ -11,9 +11,12 @@ and generates a comprehensive wordlist by combining:
 The generator uses a set to ensure all passwords are unique.
 """
 
-import os
+import functools
+import heapq
+import itertools
 import sys
-from typing import List, Set, Dict
+from collections import Counter
+from typing import List, Set, Dict, Tuple, Iterator
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -22,6 +25,80 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 import config
 from dictionary_generator.patterns import PatternGenerator
 
+# Buffer size of the binary file save_to_file streams the wordlist into
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Minimum number of base words before mutations are spread over worker
+# processes; below this, starting the pool costs more than it saves
+PARALLEL_MIN_WORDS = 500
+
+
+@functools.lru_cache(maxsize=8)
+def _numeric_suffixes(count: int) -> Tuple[str, ...]:
+    """
+    Return the decimal strings '0' .. str(count - 1), formatted once per count
+    
+    Shared by all generators in the process, so integer formatting is not
+    repeated for every base word or every run.
+    """
+    return tuple(map(str, range(count)))
+
+
+# Zero-padded month (01-12) and day (01-31) suffixes for date combinations
+_MONTH_SUFFIXES = tuple(f"{month:02d}" for month in range(1, 13))
+_DAY_SUFFIXES = tuple(f"{day:02d}" for day in range(1, 32))
+
+
+@functools.lru_cache(maxsize=8)
+def _date_suffixes(start_year: int, end_year: int) -> Tuple[str, ...]:
+    """
+    Return every date suffix for a year range: years, months, then days
+    
+    The suffixes only depend on the year range, so they are built once
+    per range and reused by later runs.
+    """
+    years = PatternGenerator().generate_year_patterns(start_year, end_year)
+    return tuple(years) + _MONTH_SUFFIXES + _DAY_SUFFIXES
+
+
+def mutation_workers(word_count: int) -> int:
+    """
+    Number of worker processes used to mutate word_count base words
+    
+    Returns 0 when the mutations run in-process: multiprocessing is
+    disabled in config, or there are fewer than PARALLEL_MIN_WORDS words
+    for each of at least two workers.
+    """
+    workers = min(config.MAX_WORKERS, word_count // PARALLEL_MIN_WORDS)
+    return workers if config.USE_MULTIPROCESSING and workers >= 2 else 0
+
+
+def _mutation_variants(
+    method_names: Tuple[str, ...],
+    words: List[str]
+) -> List[List[List[str]]]:
+    """
+    Run PatternGenerator mutations over a chunk of words
+    
+    Module-level so it can be pickled and executed in a worker process.
+    Returns, for each input word in input order, one variant list per
+    method name.
+    """
+    pattern_gen = PatternGenerator()
+    generators = [getattr(pattern_gen, name) for name in method_names]
+    return [[generate(word) for generate in generators] for word in words]
+
+
+def _init_mutation_worker(settings: Dict[str, object]) -> None:
+    """
+    Pool initializer: apply the parent process's settings in a worker
+    
+    Under the 'spawn' start method (the default on macOS and Windows)
+    workers import config afresh, so runtime overrides such as a custom
+    SPECIAL_CHARACTERS would otherwise be lost.
+    """
+    config.restore_settings(settings)
+
 
 class DictionaryGenerator:
     """
@@ -40,7 +117,18 @@ class DictionaryGenerator:
         >>> gen.save_to_file('wordlist.txt')
     """
     
-    def __init__(self):
+    # Suffixes appended to every username from a username file
+    _USERNAME_SUFFIXES = ('123', '@123', '!', '2024')
+    
+    # Mutations run by apply_mutations: (option key, PatternGenerator
+    # method, summary label)
+    _MUTATIONS = (
+        ('leetspeak', 'generate_leet_speak_patterns', 'leet-speak variants'),
+        ('uppercase', 'generate_case_variations', 'case variations'),
+        ('special', 'generate_special_char_variations', 'special character variations'),
+    )
+    
+    def __init__(self, verbose: bool = True, max_words: int = 0):
         """
         Initialize the dictionary generator
         
@@ -48,7 +136,18 @@ class DictionaryGenerator:
         - Empty wordlist (using set for uniqueness)
         - Pattern generator instance
         - Configuration defaults
+        
+        Args:
+            verbose: Print progress messages while generating and saving
+                     (pass False to silence them). Errors are always printed.
+            max_words: Stop adding words once the wordlist holds this many
+                       (0 = unlimited). Unlike save_to_file's max_words,
+                       which keeps the shortest words, this keeps the first
+                       words generated and skips the work for the rest.
         """
+        self.verbose = verbose
+        self.max_words = max_words
+        
         # Use a set to automatically handle duplicates
         self.wordlist: Set[str] = set()
         
@@ -65,6 +164,11 @@ class DictionaryGenerator:
     
     # ==================== CORE GENERATION METHODS ====================
     
+    def _log(self, message: str = ""):
+        """Print a progress message when running in verbose mode"""
+        if self.verbose:
+            print(message)
+    
     def add_word(self, word: str):
         """
         Add a single word to the wordlist
@@ -75,7 +179,7 @@ class DictionaryGenerator:
         Note:
             Empty strings and None values are automatically filtered out
         """
-        if word and len(word) > 0:
+        if word and len(word) > 0 and not self.is_full():
             self.wordlist.add(word)
     
     def add_words(self, words: List[str]):
@@ -85,8 +189,25 @@ class DictionaryGenerator:
         Args:
             words: List of password strings to add
         """
+        if not self.max_words:
+            self.wordlist.update(word for word in words if word)
+            return
+        
+        # Capped: add one at a time and stop as soon as the cap is reached
         for word in words:
-            self.add_word(word)
+            if self.is_full():
+                return
+            if word:
+                self.wordlist.add(word)
+    
+    def is_full(self) -> bool:
+        """
+        Check whether the wordlist has reached the max_words cap
+        
+        Returns:
+            bool: True if a cap is set and the wordlist holds that many words
+        """
+        return 0 < self.max_words <= len(self.wordlist)
     
     # ==================== BASE WORD GENERATION ====================
     
@@ -108,7 +229,7 @@ class DictionaryGenerator:
             >>> gen.generate_base_words(['admin', 'company', 'user'])
             [+] Adding 3 base words...
         """
-        print(f"[+] Adding {len(base_words)} base words...")
+        self._log(f"[+] Adding {len(base_words)} base words...")
         self.add_words(base_words)
         self.stats['base_words'] = len(base_words)
     
@@ -144,29 +265,23 @@ class DictionaryGenerator:
             [+] Generating date combinations (2023-2024)...
                 Generated 4 date combinations
         """
-        print(f"[+] Generating date combinations ({start_year}-{end_year})...")
-        count = 0
+        self._log(f"[+] Generating date combinations ({start_year}-{end_year})...")
         
-        # Generate year patterns using PatternGenerator
-        years = self.pattern_gen.generate_year_patterns(start_year, end_year)
+        # Years (from PatternGenerator), months (01-12) and days (01-31),
+        # cached per year range
+        suffixes = _date_suffixes(start_year, end_year)
         
-        for word in base_words:
-            # Combine with years
-            for year in years:
-                self.add_word(f"{word}{year}")
-                count += 1
-            
-            # Optional: Add month patterns (01-12)
-            for month in range(1, 13):
-                self.add_word(f"{word}{month:02d}")
-                count += 1
-            
-            # Optional: Add day patterns (01-31)
-            for day in range(1, 32):
-                self.add_word(f"{word}{day:02d}")
-                count += 1
+        # Suffixes are never empty, so no per-word empty check is needed.
+        # The combinations are built as a list first: set.update() consumes a
+        # list faster than a generator, and CPython offers no way to reserve
+        # set capacity ahead of time. With a cap they are generated lazily.
+        if self.max_words:
+            self.add_words(word + suffix for word in base_words for suffix in suffixes)
+        else:
+            self.wordlist.update([word + suffix for word in base_words for suffix in suffixes])
+        count = len(base_words) * len(suffixes)
         
-        print(f"    Generated {count} date combinations")
+        self._log(f"    Generated {count} date combinations")
         self.stats['date_patterns'] = count
     
     # ==================== NUMBER PATTERN GENERATION ====================
@@ -198,8 +313,7 @@ class DictionaryGenerator:
             [+] Generating number combinations...
                 Generated 11 number combinations
         """
-        print(f"[+] Generating number combinations...")
-        count = 0
+        self._log(f"[+] Generating number combinations...")
         
         # Common number patterns that users add
         common_numbers = [
@@ -210,19 +324,17 @@ class DictionaryGenerator:
             '@', '@@'
         ]
         
-        for word in base_words:
-            # Add common number patterns
-            for num in common_numbers:
-                self.add_word(f"{word}{num}")
-                count += 1
-            
-            # Add sequential numbers (0-max_number)
-            # But limit to prevent explosion of combinations
-            for i in range(min(100, max_number + 1)):
-                self.add_word(f"{word}{i}")
-                count += 1
+        # Common patterns plus sequential numbers (0-max_number),
+        # limited to prevent explosion of combinations
+        suffixes = common_numbers + list(_numeric_suffixes(min(100, max_number + 1)))
+        
+        if self.max_words:
+            self.add_words(word + suffix for word in base_words for suffix in suffixes)
+        else:
+            self.wordlist.update([word + suffix for word in base_words for suffix in suffixes])
+        count = len(base_words) * len(suffixes)
         
-        print(f"    Generated {count} number combinations")
+        self._log(f"    Generated {count} number combinations")
     
     # ==================== COMMON PASSWORDS ====================
     
@@ -244,7 +356,7 @@ class DictionaryGenerator:
             >>> gen.generate_common_passwords()
             [+] Adding 20 common passwords...
         """
-        print(f"[+] Adding {len(config.COMMON_PASSWORDS)} common passwords...")
+        self._log(f"[+] Adding {len(config.COMMON_PASSWORDS)} common passwords...")
         self.add_words(config.COMMON_PASSWORDS)
     
     # ==================== KEYBOARD PATTERNS ====================
@@ -267,11 +379,52 @@ class DictionaryGenerator:
             >>> gen.generate_keyboard_patterns()
             [+] Adding 16 keyboard patterns...
         """
-        print(f"[+] Adding {len(config.KEYBOARD_PATTERNS)} keyboard patterns...")
+        self._log(f"[+] Adding {len(config.KEYBOARD_PATTERNS)} keyboard patterns...")
         self.add_words(config.KEYBOARD_PATTERNS)
     
     # ==================== MUTATION METHODS ====================
     
+    def _map_mutations(
+        self,
+        method_names: Tuple[str, ...],
+        base_words: List[str]
+    ) -> Iterator[List[List[str]]]:
+        """
+        Apply PatternGenerator mutations to every base word
+        
+        Each word's variants are independent of the others, so for large
+        base word lists (PARALLEL_MIN_WORDS or more) the words are split
+        into one chunk per worker and mutated in a multiprocessing pool.
+        Set config.USE_MULTIPROCESSING = False to always run in-process.
+        
+        In-process, the variant lists are produced lazily while the caller
+        consumes them, so only one of them is alive at a time.
+        
+        Args:
+            method_names: Names of the PatternGenerator methods to call
+            base_words: Words to mutate
+        
+        Returns:
+            Iterator[List[List[str]]]: For each base word, in order, one
+            variant list per method name
+        """
+        base_words = list(base_words)
+        workers = mutation_workers(len(base_words))
+        
+        if not workers:
+            generators = [getattr(self.pattern_gen, name) for name in method_names]
+            return ([generate(word) for generate in generators] for word in base_words)
+        
+        # Imported here so single-process runs don't pay for it at startup
+        import multiprocessing
+        
+        size = -(-len(base_words) // workers)
+        chunks = [base_words[i:i + size] for i in range(0, len(base_words), size)]
+        with multiprocessing.Pool(len(chunks), _init_mutation_worker,
+                                  (config.snapshot_settings(),)) as pool:
+            results = pool.map(functools.partial(_mutation_variants, method_names), chunks)
+        return itertools.chain.from_iterable(results)
+    
     def apply_leet_speak(self, base_words: List[str]):
         """
         Apply leet-speak (1337 speak) transformations
@@ -292,21 +445,9 @@ class DictionaryGenerator:
             >>> gen = DictionaryGenerator()
             >>> gen.apply_leet_speak(['password', 'admin'])
             [+] Applying leet-speak mutations...
-                Generated 10 leet-speak variants
+                Generated 10 leet-speak variants (8 new)
         """
-        print("[+] Applying leet-speak mutations...")
-        count = 0
-        new_words = set()
-        
-        for word in base_words:
-            # Use PatternGenerator to create leet variants
-            variants = self.pattern_gen.generate_leet_speak_patterns(word)
-            new_words.update(variants)
-            count += len(variants)
-        
-        self.add_words(list(new_words))
-        print(f"    Generated {count} leet-speak variants")
-        self.stats['mutations'] += count
+        self._apply_one('leetspeak', "[+] Applying leet-speak mutations...", base_words)
     
     def apply_uppercase_variations(self, base_words: List[str]):
         """
@@ -326,21 +467,9 @@ class DictionaryGenerator:
             >>> gen = DictionaryGenerator()
             >>> gen.apply_uppercase_variations(['password'])
             [+] Applying uppercase variations...
-                Generated 4 case variations
+                Generated 4 case variations (3 new)
         """
-        print("[+] Applying uppercase variations...")
-        count = 0
-        new_words = set()
-        
-        for word in base_words:
-            # Use PatternGenerator to create case variants
-            variants = self.pattern_gen.generate_case_variations(word)
-            new_words.update(variants)
-            count += len(variants)
-        
-        self.add_words(list(new_words))
-        print(f"    Generated {count} case variations")
-        self.stats['mutations'] += count
+        self._apply_one('uppercase', "[+] Applying uppercase variations...", base_words)
     
     def apply_special_characters(self, base_words: List[str]):
         """
@@ -360,19 +489,74 @@ class DictionaryGenerator:
             >>> gen = DictionaryGenerator()
             >>> gen.apply_special_characters(['admin'])
             [+] Applying special character mutations...
+                Generated 16 special character variations (16 new)
+        """
+        self._apply_one('special', "[+] Applying special character mutations...", base_words)
+    
+    def apply_mutations(self, base_words: List[str], mutations: Dict):
+        """
+        Apply every enabled mutation in a single pass over the base words
+        
+        Equivalent to calling apply_leet_speak, apply_uppercase_variations
+        and apply_special_characters for the enabled options, but each word
+        is visited (and, for large lists, sent to a worker process) once
+        for all of them instead of once per mutation.
+        
+        Args:
+            base_words: Words to mutate
+            mutations: Mutation options ('leetspeak', 'uppercase', 'special')
+            
+        Example:
+            >>> gen = DictionaryGenerator()
+            >>> gen.apply_mutations(['admin'], {'leetspeak': True, 'special': True})
+            [+] Applying mutations (leetspeak, special)...
+                Generated 5 leet-speak variants
                 Generated 16 special character variations
+                Added 21 new words
+        """
+        selected = [m for m in self._MUTATIONS if mutations.get(m[0])]
+        if not selected:
+            return
+        
+        self._log(f"[+] Applying mutations ({', '.join(m[0] for m in selected)})...")
+        before = len(self.wordlist)
+        counts = self._run_mutations(selected, base_words)
+        
+        for (_, _, label), count in zip(selected, counts):
+            self._log(f"    Generated {count} {label}")
+        self._log(f"    Added {len(self.wordlist) - before} new words")
+    
+    def _run_mutations(self, selected: List[Tuple[str, str, str]], base_words: List[str]) -> List[int]:
+        """
+        Add the variants of the selected _MUTATIONS entries for every base word
+        
+        Shared by apply_mutations and the single-mutation apply_* methods,
+        so the word limit check and the worker pool handling live in one
+        place. Stops after the word that fills the wordlist.
+        
+        Returns:
+            Number of variants generated per selected mutation
         """
-        print("[+] Applying special character mutations...")
-        count = 0
+        counts = [0] * len(selected)
         
-        for word in base_words:
-            # Use PatternGenerator to create special char variants
-            variants = self.pattern_gen.generate_special_char_variations(word)
-            self.add_words(variants)
-            count += len(variants)
+        method_names = tuple(m[1] for m in selected)
+        for variant_lists in self._map_mutations(method_names, base_words):
+            for i, variants in enumerate(variant_lists):
+                self.add_words(variants)
+                counts[i] += len(variants)
+            if self.is_full():
+                break
         
-        print(f"    Generated {count} special character variations")
-        self.stats['mutations'] += count
+        self.stats['mutations'] += sum(counts)
+        return counts
+    
+    def _apply_one(self, option_key: str, heading: str, base_words: List[str]):
+        """Apply a single _MUTATIONS entry and log its summary line"""
+        mutation = next(m for m in self._MUTATIONS if m[0] == option_key)
+        self._log(heading)
+        before = len(self.wordlist)
+        count, = self._run_mutations([mutation], base_words)
+        self._log(f"    Generated {count} {mutation[2]} ({len(self.wordlist) - before} new)")
     
     # ==================== USERNAME FILE PROCESSING ====================
     
@@ -400,35 +584,43 @@ class DictionaryGenerator:
             [+] Reading usernames from usernames.txt...
                 Found 50 usernames
         """
-        if not os.path.exists(filepath):
+        # Open directly instead of checking os.path.exists() first (one stat less)
+        try:
+            f = open(filepath, 'r', encoding='utf-8')
+        except FileNotFoundError:
             print(f"[-] Username file not found: {filepath}")
             return
+        except OSError as e:
+            print(f"[-] Error reading username file: {e}")
+            return
         
-        print(f"[+] Reading usernames from {filepath}...")
+        self._log(f"[+] Reading usernames from {filepath}...")
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                usernames = [line.strip() for line in f if line.strip()]
+            with f:
+                # Interned: each username is stored once even when it is
+                # also a base word or common password
+                usernames = [sys.intern(name) for line in f if (name := line.strip())]
             
-            print(f"    Found {len(usernames)} usernames")
+            self._log(f"    Found {len(usernames)} usernames")
             
             # Add usernames as-is
             self.add_words(usernames)
             
             # Generate common username-based passwords
-            for username in usernames:
-                # Common patterns
-                self.add_word(f"{username}123")
-                self.add_word(f"{username}@123")
-                self.add_word(f"{username}!")
-                self.add_word(f"{username}2024")
-                
-                # Remove dots and underscores
-                cleaned = username.replace('.', '').replace('_', '')
-                if cleaned != username:
-                    self.add_word(cleaned)
-                    self.add_word(f"{cleaned}123")
-                
+            self.add_words(
+                username + suffix
+                for username, suffix in itertools.product(usernames, self._USERNAME_SUFFIXES)
+            )
+            
+            # Remove dots and underscores
+            cleaned = [
+                name for username in usernames
+                if (name := username.replace('.', '').replace('_', '')) != username
+            ]
+            self.add_words(cleaned)
+            self.add_words(name + '123' for name in cleaned)
+            
         except Exception as e:
             print(f"[-] Error reading username file: {e}")
     
@@ -474,9 +666,9 @@ class DictionaryGenerator:
             >>> count = gen.generate_dictionary(config)
             >>> print(f"Generated {count} passwords")
         """
-        print("\n" + "="*60)
-        print("DICTIONARY GENERATION STARTED")
-        print("="*60)
+        self._log("\n" + "="*60)
+        self._log("DICTIONARY GENERATION STARTED")
+        self._log("="*60)
         
         # Extract configuration
         base_words = user_config.get('base_words', [])
@@ -487,12 +679,16 @@ class DictionaryGenerator:
             print("[-] No base words provided!")
             return 0
         
+        # Base words typically come from input() or a config file; intern
+        # them so duplicates elsewhere in the wordlist share one object
+        base_words = [sys.intern(word) for word in base_words]
+        
         # STEP 1: Add base words
         self.generate_base_words(base_words)
         
         # STEP 2: Process username file if provided
         username_file = user_config.get('username_file')
-        if username_file and os.path.exists(username_file):
+        if username_file:
             self.generate_from_username_file(username_file)
         
         # STEP 3: Generate date patterns
@@ -515,31 +711,59 @@ class DictionaryGenerator:
         if mutations.get('numbers', True):
             self.generate_with_numbers(base_words)
         
-        # STEP 7: Apply mutations to base words
-        # Create a snapshot of current words to mutate
-        current_words = list(self.wordlist)[:len(base_words) * 10]  # Limit to prevent explosion
-        
-        if mutations.get('leetspeak'):
-            self.apply_leet_speak(base_words)
+        # STEP 7: Apply mutations to base words (all enabled ones in one pass)
+        self.apply_mutations(base_words, mutations)
         
-        if mutations.get('uppercase'):
-            self.apply_uppercase_variations(base_words)
-        
-        if mutations.get('special'):
-            self.apply_special_characters(base_words)
+        if self.is_full():
+            self._log(f"[!] Reached the {self.max_words:,} word limit, later words were skipped")
         
         # Update statistics
         self.stats['total_generated'] = len(self.wordlist)
         
-        print("\n" + "="*60)
-        print(f"GENERATION COMPLETE: {len(self.wordlist):,} unique words")
-        print("="*60)
+        self._log("\n" + "="*60)
+        self._log(f"GENERATION COMPLETE: {len(self.wordlist):,} unique words")
+        self._log("="*60)
         
         return len(self.wordlist)
     
     # ==================== OUTPUT METHODS ====================
     
-    def save_to_file(self, filepath: str, max_words: int = 0):
+    def _sorted_buckets(self, max_words: int = 0) -> Iterator[List[str]]:
+        """
+        Yield the wordlist as sorted same-length buckets, shortest first
+        
+        Words are bucketed by length (len() runs once per word) and each
+        bucket is sorted with the plain string comparison, which avoids a
+        Python key function call for every comparison. With max_words set,
+        the last bucket is cut so that at most max_words words are yielded.
+        """
+        buckets: Dict[int, List[str]] = {}
+        for word in self.wordlist:
+            buckets.setdefault(len(word), []).append(word)
+        
+        remaining = max_words if max_words > 0 else len(self.wordlist)
+        for length in sorted(buckets):
+            bucket = buckets.pop(length)
+            bucket.sort()
+            if len(bucket) >= remaining:
+                yield bucket[:remaining]
+                return
+            remaining -= len(bucket)
+            yield bucket
+    
+    def sorted_words(self, max_words: int = 0) -> List[str]:
+        """
+        Get the wordlist sorted by length, then alphabetically
+        
+        Args:
+            max_words: Maximum words to return (0 = all), shortest first
+        
+        Returns:
+            Sorted list of words
+        """
+        return list(itertools.chain.from_iterable(self._sorted_buckets(max_words)))
+    
+    def save_to_file(self, filepath: str, max_words: int = 0) -> bool:
         """
         Save the generated wordlist to a file
         
@@ -549,6 +773,9 @@ class DictionaryGenerator:
         Args:
             filepath: Output file path
             max_words: Maximum words to save (0 = save all)
+        
+        Returns:
+            bool: True if the file was written, False on error
             
         Example:
             >>> gen = DictionaryGenerator()
@@ -557,33 +784,34 @@ class DictionaryGenerator:
             [✓] Saved 10000 words to wordlist.txt
                 File size: 85.3 KB
         """
-        print(f"\n[+] Saving dictionary to {filepath}...")
+        self._log(f"\n[+] Saving dictionary to {filepath}...")
         
         try:
-            # Convert set to list and sort
-            words_to_save = list(self.wordlist)
+            if max_words > 0 and len(self.wordlist) > max_words:
+                self._log(f"    Limited to {max_words:,} words")
             
             # Sort by length first, then alphabetically
-            # This makes the file more organized and easier to analyze
-            words_to_save.sort(key=lambda x: (len(x), x))
-            
-            # Limit if specified
-            if max_words > 0 and len(words_to_save) > max_words:
-                words_to_save = words_to_save[:max_words]
-                print(f"    Limited to {max_words:,} words")
-            
-            # Write to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                for word in words_to_save:
-                    f.write(word + '\n')
+            # This makes the file more organized and easier to analyze.
+            # Each length bucket is encoded and streamed to a large binary
+            # buffer as soon as it is sorted, so neither the full sorted list
+            # nor the whole encoded file is ever held in memory
+            saved = 0
+            with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                for bucket in self._sorted_buckets(max_words):
+                    f.write('\n'.join(bucket).encode('utf-8'))
+                    f.write(b'\n')
+                    saved += len(bucket)
+                file_size = f.tell()
             
             # Show success message with file size
-            file_size_kb = os.path.getsize(filepath) / 1024
-            print(f"[✓] Saved {len(words_to_save):,} words to {filepath}")
-            print(f"    File size: {file_size_kb:.2f} KB")
+            file_size_kb = file_size / 1024
+            self._log(f"[✓] Saved {saved:,} words to {filepath}")
+            self._log(f"    File size: {file_size_kb:.2f} KB")
+            return True
             
         except Exception as e:
             print(f"[-] Error saving file: {e}")
+            return False
     
     # ==================== STATISTICS AND REPORTING ====================
     
@@ -603,17 +831,21 @@ class DictionaryGenerator:
             >>> stats = gen.get_statistics()
             >>> print(stats['total_words'])
         """
-        words = list(self.wordlist)
-        
-        if not words:
+        if not self.wordlist:
             return {}
         
+        # The wordlist is a set, so every word is already unique. One pass
+        # accumulates a count per word length (a handful of entries), and
+        # min/max/average are read from those counts
+        length_counts = Counter(map(len, self.wordlist))
+        total = len(self.wordlist)
+        
         return {
-            'total_words': len(words),
-            'min_length': min(len(w) for w in words),
-            'max_length': max(len(w) for w in words),
-            'avg_length': sum(len(w) for w in words) / len(words),
-            'unique_words': len(set(words))
+            'total_words': total,
+            'min_length': min(length_counts),
+            'max_length': max(length_counts),
+            'avg_length': sum(length * count for length, count in length_counts.items()) / total,
+            'unique_words': total
         }
     
     def print_statistics(self):
@@ -664,18 +896,20 @@ class DictionaryGenerator:
                   3. #admin
                   ... and 1,227 more
         """
-        words = list(self.wordlist)
+        total = len(self.wordlist)
         
-        if not words:
+        if not total:
             print("[-] No words in dictionary")
             return
         
-        print(f"\n[+] Sample words ({min(count, len(words))} of {len(words):,}):")
-        for i, word in enumerate(sorted(words)[:count], 1):
+        # Only the first N words are shown, so select them with a heap
+        # instead of sorting the whole wordlist
+        print(f"\n[+] Sample words ({min(count, total)} of {total:,}):")
+        for i, word in enumerate(heapq.nsmallest(count, self.wordlist), 1):
             print(f"    {i:3d}. {word}")
         
-        if len(words) > count:
-            print(f"    ... and {len(words) - count:,} more")
+        if total > count:
+            print(f"    ... and {total - count:,} more")
 
 
 # ==================== STANDALONE USAGE ====================
@@ -706,7 +940,7 @@ def main():
     }
     
     # Create generator
-    generator = DictionaryGenerator()
+    generator = DictionaryGenerator(verbose=config.VERBOSE_OUTPUT)
     
     # Generate dictionary
     word_count = generator.generate_dictionary(example_config)
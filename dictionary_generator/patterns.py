@@ -11,7 +11,10 @@ This module contains classes and functions for generating various password patte
 These patterns are used by the DictionaryGenerator to create comprehensive wordlists.
 """
 
-from typing import List, Set
+import functools
+import itertools
+import math
+from typing import List, Tuple
 import config
 
 
@@ -24,8 +27,13 @@ class PatternGenerator:
     """
     
     def __init__(self):
-        """Initialize the pattern generator with default settings"""
-        self.patterns: Set[str] = set()
+        """
+        Initialize the pattern generator with default settings
+        
+        The generator keeps no per-instance state: every method returns a
+        fresh list, and deduplication happens once, in the caller's
+        wordlist (DictionaryGenerator.wordlist).
+        """
     
     # ==================== DATE PATTERNS ====================
     
@@ -49,16 +57,7 @@ class PatternGenerator:
             >>> print(years)
             ['2023', '23', '2024', '24']
         """
-        years = []
-        
-        for year in range(start_year, end_year + 1):
-            # Full year format (e.g., 2024)
-            years.append(str(year))
-            
-            # Two-digit year format (e.g., 24)
-            years.append(str(year)[2:])
-        
-        return years
+        return list(_year_patterns(start_year, end_year))
     
     def generate_month_patterns(self) -> List[str]:
         """
@@ -78,28 +77,7 @@ class PatternGenerator:
             >>> '01' in months and 'january' in months
             True
         """
-        months = []
-        
-        # Numeric months
-        for month in range(1, 13):
-            months.append(str(month))          # 1, 2, 3...
-            months.append(f"{month:02d}")      # 01, 02, 03...
-        
-        # Month names (optional - can be added if needed)
-        month_names = [
-            'january', 'february', 'march', 'april', 'may', 'june',
-            'july', 'august', 'september', 'october', 'november', 'december'
-        ]
-        
-        # Short month names
-        month_short = ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
-                      'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-        
-        # Uncomment to include month names
-        # months.extend(month_names)
-        # months.extend(month_short)
-        
-        return months
+        return list(_month_patterns())
     
     def generate_day_patterns(self) -> List[str]:
         """
@@ -118,13 +96,7 @@ class PatternGenerator:
             >>> '01' in days and '31' in days
             True
         """
-        days = []
-        
-        for day in range(1, 32):
-            days.append(str(day))          # 1, 2, 3...
-            days.append(f"{day:02d}")      # 01, 02, 03...
-        
-        return days
+        return list(_day_patterns())
     
     # ==================== NUMBER SEQUENCES ====================
     
@@ -149,25 +121,7 @@ class PatternGenerator:
             >>> '123' in seqs and '1111' in seqs
             True
         """
-        sequences = []
-        
-        # Sequential numbers (123, 1234, 12345...)
-        for length in range(1, max_length + 1):
-            sequences.append(''.join(str(i) for i in range(length)))
-        
-        # Repeated digits (111, 222, 1111, 2222...)
-        for digit in range(10):
-            for length in range(2, max_length + 1):
-                sequences.append(str(digit) * length)
-        
-        # Common significant numbers
-        common_numbers = [
-            '007', '69', '420', '666', '777', '888', '999',
-            '000', '101', '143', '1337'  # 1337 = "leet"
-        ]
-        sequences.extend(common_numbers)
-        
-        return sequences
+        return list(_number_sequences(max_length))
     
     # ==================== KEYBOARD PATTERNS ====================
     
@@ -189,36 +143,7 @@ class PatternGenerator:
             >>> 'qwerty' in patterns and 'asdfgh' in patterns
             True
         """
-        patterns = []
-        
-        # QWERTY keyboard rows
-        keyboard_rows = [
-            'qwertyuiop',    # Top row
-            'asdfghjkl',     # Home row
-            'zxcvbnm',       # Bottom row
-        ]
-        
-        # Add full rows and substrings
-        for row in keyboard_rows:
-            patterns.append(row)
-            
-            # Add substrings (minimum 4 characters)
-            for i in range(len(row) - 3):
-                for j in range(i + 4, len(row) + 1):
-                    patterns.append(row[i:j])
-        
-        # Common keyboard walks
-        common_walks = [
-            '1qaz2wsx',      # Left hand vertical walk
-            'qazwsx',        # Diagonal walk
-            '!qaz@wsx',      # With shift
-            '1q2w3e4r',      # Alternating pattern
-            'qweasd',        # Two rows
-            '123qwe',        # Numbers to letters
-        ]
-        patterns.extend(common_walks)
-        
-        return patterns
+        return list(_keyboard_walking_patterns())
     
     # ==================== SPECIAL PATTERNS ====================
     
@@ -249,18 +174,65 @@ class PatternGenerator:
         word_lower = word.lower()
         
         # Simple single-character replacements
-        # We limit to basic substitutions to avoid exponential growth
+        # We limit to basic substitutions to avoid exponential growth.
+        # The (char, replacement) pairs are flattened once in config, so each
+        # call is a single pass of C-level str.replace calls
+        variations.extend([
+            word_lower.replace(char, replacement)
+            for char, replacement in config.LEET_SUBSTITUTIONS
+            if char in word_lower
+        ])
         
-        leet_map = config.LEET_SPEAK_MAP
+        return variations
+    
+    def generate_leet_speak_combinations(
+        self,
+        word: str,
+        max_variants: int = 1000
+    ) -> List[str]:
+        """
+        Generate every combination of leet-speak substitutions for a word
         
-        for char, replacements in leet_map.items():
-            if char in word_lower:
-                # Try each replacement
-                for replacement in replacements[1:]:  # Skip original character
-                    variant = word_lower.replace(char, replacement)
-                    variations.append(variant)
+        Unlike generate_leet_speak_patterns(), which replaces one character
+        class at a time, this mixes substitutions freely (p@ssw0rd, p4$sw0rd...).
+        The number of combinations is the product of the choices per
+        character, so the output is capped.
         
-        return variations
+        Args:
+            word: Word to convert to leet-speak
+            max_variants: Maximum number of variants to return
+        
+        Returns:
+            List of leet-speak combinations (including the lowercase word)
+            
+        Example:
+            >>> gen = PatternGenerator()
+            >>> combos = gen.generate_leet_speak_combinations('at')
+            >>> sorted(combos)
+            ['47', '4t', '@7', '@t', 'a7', 'at']
+        """
+        choices = config.LEET_CHOICES
+        positions = [choices[ord(c)] if ord(c) < 256 else c for c in word.lower()]
+        
+        # Large products that fit in max_variants use the expander compiled
+        # for the word's shape: its substitutable positions, with the fixed
+        # text between them passed in. Small products aren't worth the split
+        total = math.prod(map(len, positions))
+        if _LEET_EXPANDER_MIN_PRODUCT <= total <= max_variants:
+            shape = []
+            fixed = ['']
+            for choice in positions:
+                if len(choice) > 1:
+                    shape.append(choice)
+                    fixed.append('')
+                else:
+                    fixed[-1] += choice
+            
+            if len(shape) <= _LEET_EXPANDER_MAX_SHAPE:
+                return _leet_expander(tuple(shape))(fixed)
+        
+        combos = itertools.islice(itertools.product(*positions), max_variants)
+        return [''.join(combo) for combo in combos]
     
     def generate_case_variations(self, word: str) -> List[str]:
         """
@@ -284,26 +256,33 @@ class PatternGenerator:
             >>> 'Password' in variations and 'PASSWORD' in variations
             True
         """
-        variations = []
-        
-        # All lowercase
-        variations.append(word.lower())
-        
-        # All uppercase
-        variations.append(word.upper())
+        # Each case mapping runs once; alternating case is sliced from them
+        lower = word.lower()
+        upper = word.upper()
         
-        # First letter uppercase (Title case)
-        variations.append(word.capitalize())
+        # All lowercase, all uppercase, first letter uppercase (Title case)
+        variations = [lower, upper, word.capitalize()]
         
         # Alternating case (for shorter words only)
         if len(word) <= 10:
-            alternating = ''.join(
-                c.upper() if i % 2 == 0 else c.lower()
-                for i, c in enumerate(word)
-            )
+            if word.isascii():
+                # ASCII case mapping is one-to-one, so take the lowercase word
+                # and overwrite the even positions with one slice assignment
+                chars = list(lower)
+                chars[0::2] = upper[0::2]
+                alternating = ''.join(chars)
+            else:
+                # Non-ASCII case mapping can change length (ß -> SS)
+                alternating = ''.join(
+                    c.upper() if i % 2 == 0 else c.lower()
+                    for i, c in enumerate(word)
+                )
             variations.append(alternating)
         
-        return variations
+        # Drop collisions such as word.lower() == word before the caller
+        # inserts them. dict.fromkeys keeps the order, and the str hash it
+        # computes is cached on each string, so the wordlist set reuses it
+        return list(dict.fromkeys(variations))
     
     def generate_special_char_variations(self, word: str) -> List[str]:
         """
@@ -329,12 +308,15 @@ class PatternGenerator:
         
         special_chars = config.SPECIAL_CHARACTERS
         
+        # A plain loop with + is the fastest form for this handful of
+        # characters: map(word.__add__, ...), comprehensions and slice
+        # assignment into a preallocated list all measured slower
         for char in special_chars:
             # Append special character
-            variations.append(f"{word}{char}")
+            variations.append(word + char)
             
             # Prepend special character
-            variations.append(f"{char}{word}")
+            variations.append(char + word)
         
         return variations
     
@@ -370,26 +352,193 @@ class PatternGenerator:
             >>> 'admin123' in combos and 'admin2024' in combos
             True
         """
-        combinations = []
-        count = 0
-        
-        for word in words:
-            for number in numbers:
-                if count >= max_combinations:
-                    break
-                    
-                # Word + Number
-                combinations.append(f"{word}{number}")
-                count += 1
-                
-            if count >= max_combinations:
-                break
-        
-        return combinations
+        # Word + Number, in word-major order; product() and islice() run the
+        # loop and the cap in C, so there is no per-item counter or branch
+        pairs = itertools.product(words, numbers)
+        return list(itertools.islice(
+            itertools.starmap(str.__add__, pairs),
+            max(max_combinations, 0)
+        ))
 
 
 # ==================== HELPER FUNCTIONS ====================
 
+# The pattern builders below are pure Python and hold the GIL the whole
+# time, so running them in a thread pool would not overlap any work. They
+# are cached instead, and the common cases are built at import (see the
+# end of this module).
+
+@functools.lru_cache(maxsize=32)
+def _year_patterns(start_year: int, end_year: int) -> Tuple[str, ...]:
+    """Build the year patterns for a year range (cached per range)"""
+    # Full year format (e.g., 2024)
+    full_years = list(map(str, range(start_year, end_year + 1)))
+    
+    # Preallocate and fill both formats in place, interleaved per year
+    years = [''] * (2 * len(full_years))
+    years[0::2] = full_years
+    
+    # Two-digit year format (e.g., 24)
+    years[1::2] = [year[2:] for year in full_years]
+    
+    return tuple(years)
+
+
+@functools.lru_cache(maxsize=None)
+def _month_patterns() -> Tuple[str, ...]:
+    """Build the month patterns once per process"""
+    # Numeric months, preallocated and filled interleaved
+    months = [''] * 24
+    months[0::2] = [str(month) for month in range(1, 13)]          # 1, 2, 3...
+    months[1::2] = [f"{month:02d}" for month in range(1, 13)]      # 01, 02, 03...
+    
+    # Month names (optional - can be added if needed)
+    month_names = [
+        'january', 'february', 'march', 'april', 'may', 'june',
+        'july', 'august', 'september', 'october', 'november', 'december'
+    ]
+    
+    # Short month names
+    month_short = ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
+                  'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
+    
+    # Uncomment to include month names
+    # months.extend(month_names)
+    # months.extend(month_short)
+    
+    return tuple(months)
+
+
+@functools.lru_cache(maxsize=None)
+def _day_patterns() -> Tuple[str, ...]:
+    """Build the day patterns once per process"""
+    # Preallocated and filled interleaved
+    days = [''] * 62
+    days[0::2] = [str(day) for day in range(1, 32)]          # 1, 2, 3...
+    days[1::2] = [f"{day:02d}" for day in range(1, 32)]      # 01, 02, 03...
+    
+    return tuple(days)
+
+
+@functools.lru_cache(maxsize=32)
+def _number_sequences(max_length: int) -> Tuple[str, ...]:
+    """Build the number sequences for a maximum length (cached per length)"""
+    # Sequential numbers (123, 1234, 12345...): every sequence is a prefix
+    # of the longest one, so build that once and slice the rest from it
+    parts = list(map(str, range(max_length)))
+    longest = ''.join(parts)
+    sequences = [longest[:end] for end in itertools.accumulate(map(len, parts))]
+    
+    # Repeated digits (111, 222, 1111, 2222...)
+    sequences += [
+        digit * length
+        for digit in '0123456789'
+        for length in range(2, max_length + 1)
+    ]
+    
+    # Common significant numbers
+    common_numbers = [
+        '007', '69', '420', '666', '777', '888', '999',
+        '000', '101', '143', '1337'  # 1337 = "leet"
+    ]
+    sequences.extend(common_numbers)
+    
+    return tuple(sequences)
+
+
+# Longest shape _leet_expander compiles; Python allows at most 20
+# statically nested blocks, and longer words fall back to itertools.product
+_LEET_EXPANDER_MAX_SHAPE = 16
+
+# Smallest number of combinations for which the compiled expander beats
+# itertools.product (measured: about equal at 54 for 'password')
+_LEET_EXPANDER_MIN_PRODUCT = 128
+
+
+@functools.lru_cache(maxsize=256)
+def _leet_expander(shape: Tuple[str, ...]):
+    """
+    Compile a function that expands every leet combination for one word shape
+    
+    shape holds the choice strings of a word's substitutable positions, e.g.
+    ('a@4', 's$5', 's$5', 'o0') for 'password'. The generated function takes
+    the fixed text around those positions (['p', '', '', 'w', 'rd']) and
+    emits the same combinations as itertools.product, in the same order,
+    using nested loops with the choices unrolled as literals. Words with
+    the same shape ('password', 'passwort') share one compiled function.
+    
+    Only config choice strings are placed in the source (via repr); the
+    word text is passed in as an argument.
+    """
+    last = len(shape) - 1
+    lines = ['def _expand(fixed):', '    prefix = fixed[0]']
+    
+    # Join each choice with the fixed text that follows it once, up front
+    for i, choice in enumerate(shape):
+        names = ''.join(f'v{i}_{k}, ' for k in range(len(choice)))
+        lines.append(f'    {names}= [c + fixed[{i + 1}] for c in {choice!r}]')
+    lines.append('    out = []')
+    lines.append('    append = out.append')
+    
+    # One loop per position except the last, whose choices are unrolled
+    indent = '    '
+    for i in range(last):
+        names = ', '.join(f'v{i}_{k}' for k in range(len(shape[i])))
+        lines.append(f'{indent}for s{i} in ({names},):')
+        indent += '    '
+        lines.append(f'{indent}p{i} = {"prefix" if i == 0 else f"p{i - 1}"} + s{i}')
+    
+    prefix = 'prefix' if last == 0 else f'p{last - 1}'
+    for k in range(len(shape[last])):
+        lines.append(f'{indent}append({prefix} + v{last}_{k})')
+    lines.append('    return out')
+    
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['_expand']
+
+
+@functools.lru_cache(maxsize=None)
+def _keyboard_walking_patterns() -> Tuple[str, ...]:
+    """
+    Build the keyboard walking patterns once per process
+    
+    The patterns are fixed, so the row substrings are sliced on the first
+    call only; PatternGenerator.generate_keyboard_walking_patterns() returns
+    a fresh list copy of this tuple.
+    """
+    patterns = []
+    
+    # QWERTY keyboard rows
+    keyboard_rows = [
+        'qwertyuiop',    # Top row
+        'asdfghjkl',     # Home row
+        'zxcvbnm',       # Bottom row
+    ]
+    
+    # Add full rows and substrings
+    for row in keyboard_rows:
+        patterns.append(row)
+        
+        # Add substrings (minimum 4 characters)
+        for i in range(len(row) - 3):
+            for j in range(i + 4, len(row) + 1):
+                patterns.append(row[i:j])
+    
+    # Common keyboard walks
+    common_walks = [
+        '1qaz2wsx',      # Left hand vertical walk
+        'qazwsx',        # Diagonal walk
+        '!qaz@wsx',      # With shift
+        '1q2w3e4r',      # Alternating pattern
+        'qweasd',        # Two rows
+        '123qwe',        # Numbers to letters
+    ]
+    patterns.extend(common_walks)
+    
+    return tuple(patterns)
+
+
 def get_common_passwords() -> List[str]:
     """
     Return list of commonly used passwords
@@ -400,7 +549,7 @@ def get_common_passwords() -> List[str]:
     Returns:
         List of common passwords
     """
-    return config.COMMON_PASSWORDS.copy()
+    return list(config.COMMON_PASSWORDS_ORDERED)
 
 
 def get_keyboard_patterns() -> List[str]:
@@ -410,7 +559,15 @@ def get_keyboard_patterns() -> List[str]:
     Returns:
         List of keyboard patterns
     """
-    return config.KEYBOARD_PATTERNS.copy()
+    return list(config.KEYBOARD_PATTERNS_ORDERED)
+
+
+# Build the fixed patterns and the ones for the default arguments while the
+# module is imported, so generation runs start with warm caches
+_month_patterns()
+_day_patterns()
+_year_patterns(config.DEFAULT_START_YEAR, config.DEFAULT_END_YEAR)
+_number_sequences(6)
 
 
 # ==================== TESTING ====================
@@ -10,20 +10,54 @@ Usage:
     python3 main.py              # Interactive mode
     python3 main.py --demo       # Demo mode with sample data
     python3 main.py --help       # Show help
+    
+    # Batch mode (no menu or prompts)
+    python3 main.py --agree --base-words admin,acme --max-words 50000
+    python3 main.py --agree --config dictionary.json --output out.txt
 """
 
 import sys
 import os
 import json
 import argparse
+import functools
 from datetime import datetime
 from pathlib import Path
+from typing import Tuple
 
 # Import configuration
 import config
 
 # Import modules
-from dictionary_generator.generator import DictionaryGenerator
+from dictionary_generator.generator import DictionaryGenerator, mutation_workers
+
+
+@functools.lru_cache(maxsize=4)
+def _banner_parts(version: str, base_dir: str) -> Tuple[str, str]:
+    """
+    Build the banner text before and after the current time
+    
+    Everything except the time is fixed for a given version and project
+    directory, so the box art is padded and joined once and print_banner
+    only inserts the time.
+    """
+    head = f"""
+╔══════════════════════════════════════════════════════════════╗
+║                                                              ║
+║   PASSWORD CRACKING & CREDENTIAL ATTACK SUITE                ║
+║   Version {version:50s}║
+║                                                              ║
+║   ⚠️  Educational Use Only - Authorized Testing Required    ║
+║                                                              ║
+╚══════════════════════════════════════════════════════════════╝
+
+Current Time: """
+    tail = f"""
+Project Directory: {base_dir}
+
+{'=' * 60}
+"""
+    return head, tail
 
 
 class PasswordCrackingSuite:
@@ -40,21 +74,8 @@ class PasswordCrackingSuite:
     
     def print_banner(self):
         """Display application banner with ASCII art"""
-        banner = f"""
-╔══════════════════════════════════════════════════════════════╗
-║                                                              ║
-║   PASSWORD CRACKING & CREDENTIAL ATTACK SUITE                ║
-║   Version {config.APP_VERSION:50s}║
-║                                                              ║
-║   ⚠️  Educational Use Only - Authorized Testing Required    ║
-║                                                              ║
-╚══════════════════════════════════════════════════════════════╝
-
-Current Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Project Directory: {config.BASE_DIR}
-"""
-        print(banner)
-        print("="*60)
+        head, tail = _banner_parts(config.APP_VERSION, str(config.BASE_DIR))
+        sys.stdout.write(head + datetime.now().strftime('%Y-%m-%d %H:%M:%S') + tail)
     
     def show_disclaimer(self) -> bool:
         """
@@ -66,7 +87,7 @@ Project Directory: {config.BASE_DIR}
         if not config.REQUIRE_DISCLAIMER_ACCEPTANCE:
             return True
         
-        print("\n" + config.DISCLAIMER_TEXT)
+        print("\n" + config.get_disclaimer_text())
         
         while True:
             response = input("\nType 'I AGREE' to continue: ").strip().upper()
@@ -136,14 +157,15 @@ Select an option (0-12): """
             cfg['base_words'] = [w.strip() for w in base_input.split(',')]
         else:
             print("  Using default words...")
-            cfg['base_words'] = config.DEFAULT_BASE_WORDS
+            cfg['base_words'] = list(config.DEFAULT_BASE_WORDS_ORDERED)
         
         print(f"  ✓ Using {len(cfg['base_words'])} base words")
         
         # Username file (optional)
         print("\n[Step 2] Username file (optional, press Enter to skip):")
-        username_file = input("  Path: ").strip()
-        cfg['username_file'] = username_file if os.path.exists(username_file) else ''
+        # Not checked here: the generator opens the file when it runs and
+        # reports a missing file then, instead of silently dropping it
+        cfg['username_file'] = input("  Path: ").strip()
         
         # Date patterns
         print("\n[Step 3] Include date patterns? (y/n)")
@@ -198,6 +220,9 @@ Select an option (0-12): """
         
         Args:
             custom_config: Optional pre-configured settings
+        
+        Returns:
+            True if a wordlist was generated and saved
         """
         print("\n" + "="*60)
         print("DICTIONARY GENERATION MODULE")
@@ -213,7 +238,13 @@ Select an option (0-12): """
         self.config_data['dictionary'] = cfg
         
         # Create generator
-        generator = DictionaryGenerator()
+        generator = DictionaryGenerator(verbose=config.VERBOSE_OUTPUT)
+        
+        # Large base word lists have their mutations sharded across a
+        # multiprocessing pool inside the generator
+        workers = mutation_workers(len(cfg.get('base_words', [])))
+        if workers:
+            print(f"[+] Mutations will run in {workers} worker processes")
         
         # Generate
         try:
@@ -230,13 +261,17 @@ Select an option (0-12): """
                 generator.print_sample(20)
                 
                 # Save
-                generator.save_to_file(cfg['output_file'], cfg.get('max_words', 0))
+                config.ensure_output_dirs()
+                if not generator.save_to_file(cfg['output_file'], cfg.get('max_words', 0)):
+                    print("\n❌ FAILED! Wordlist could not be saved.")
+                    return False
                 
                 # Store for later use
                 self.current_wordlist = cfg['output_file']
                 
                 print("\n✅ SUCCESS! Dictionary generation completed.")
                 print(f"   Wordlist saved to: {cfg['output_file']}")
+                return True
             else:
                 print("\n❌ FAILED! No words generated.")
         
@@ -244,12 +279,12 @@ Select an option (0-12): """
             print(f"\n❌ ERROR: {e}")
             import traceback
             traceback.print_exc()
-    
-    def quick_generate(self):
-        """Quick generation with default settings"""
-        print("\n[Quick Generate] Using default settings...")
         
-        default_cfg = {
+        return False
+    
+    def default_dictionary_config(self) -> dict:
+        """Dictionary settings used by Quick Generate and as the batch mode base"""
+        return {
             'base_words': ['admin', 'password', 'user', 'test', '2024'],
             'username_file': '',
             'use_dates': True,
@@ -266,8 +301,135 @@ Select an option (0-12): """
             'output_file': str(config.WORDLIST_DIR / 'quick_wordlist.txt'),
             'max_words': 5000
         }
+    
+    def quick_generate(self):
+        """Quick generation with default settings"""
+        print("\n[Quick Generate] Using default settings...")
+        self.run_dictionary_generation(self.default_dictionary_config())
+    
+    def build_batch_config(self, args) -> dict:
+        """
+        Build dictionary settings from command line arguments
+        
+        Starts from the Quick Generate defaults, applies the JSON file given
+        with --config (same keys as the interactive configuration), then
+        the individual command line options.
         
-        self.run_dictionary_generation(default_cfg)
+        Args:
+            args: Parsed command line arguments
+        
+        Returns:
+            Dictionary with generation settings
+        
+        Raises:
+            ValueError: If an option or the settings file is invalid
+        """
+        cfg = self.default_dictionary_config()
+        
+        if args.config:
+            with open(args.config, 'r') as f:
+                file_cfg = json.load(f)
+            self.check_settings_file(file_cfg, cfg)
+            mutations = {**cfg['mutations'], **file_cfg.pop('mutations', {})}
+            cfg.update(file_cfg)
+            cfg['mutations'] = mutations
+        
+        if args.base_words:
+            cfg['base_words'] = [w.strip() for w in args.base_words.split(',') if w.strip()]
+        if args.years:
+            start, _, end = args.years.partition('-')
+            cfg['use_dates'] = True
+            cfg['start_year'] = int(start)
+            cfg['end_year'] = int(end or start)
+        if args.mutations is not None:
+            enabled = {m.strip() for m in args.mutations.split(',') if m.strip()}
+            unknown = enabled.difference(cfg['mutations'])
+            if unknown:
+                raise ValueError(
+                    f"unknown mutation(s) {', '.join(sorted(unknown))} "
+                    f"(choose from {', '.join(cfg['mutations'])})"
+                )
+            cfg['mutations'] = {name: name in enabled for name in cfg['mutations']}
+        if args.output:
+            cfg['output_file'] = args.output
+        if args.max_words is not None:
+            cfg['max_words'] = args.max_words
+        
+        # Range checks on the merged settings, so they cover both the
+        # settings file and the command line options
+        if cfg['max_words'] < 0:
+            raise ValueError(f"max words must be >= 0 (0 = unlimited), got {cfg['max_words']}")
+        if cfg['use_dates'] and cfg['start_year'] > cfg['end_year']:
+            raise ValueError(
+                f"start year {cfg['start_year']} is after end year {cfg['end_year']}"
+            )
+        
+        return cfg
+    
+    def check_settings_file(self, file_cfg, defaults: dict):
+        """
+        Check a batch mode settings file against the default settings
+        
+        The file must hold a JSON object whose keys are default settings,
+        each with a value of the same type as the default: base_words a
+        list of strings, mutations an object mapping mutation names to
+        true/false.
+        
+        Args:
+            file_cfg: Parsed settings file
+            defaults: Default dictionary settings
+        
+        Raises:
+            ValueError: If the file holds anything else
+        """
+        if not isinstance(file_cfg, dict):
+            raise ValueError("settings file must contain a JSON object")
+        
+        errors = []
+        for key, value in file_cfg.items():
+            if key not in defaults:
+                errors.append(f"unknown setting '{key}'")
+            elif key == 'base_words':
+                if not (isinstance(value, list) and all(isinstance(w, str) for w in value)):
+                    errors.append("'base_words' must be a list of strings")
+            elif key == 'mutations':
+                if not (isinstance(value, dict) and all(
+                        name in defaults['mutations'] and isinstance(enabled, bool)
+                        for name, enabled in value.items())):
+                    errors.append(
+                        f"'mutations' must map {', '.join(defaults['mutations'])} to true/false"
+                    )
+            # type() rather than isinstance(), so true/false is not taken as a number
+            elif type(value) is not type(defaults[key]):
+                errors.append(
+                    f"'{key}' must be {type(defaults[key]).__name__}, got {type(value).__name__}"
+                )
+        
+        if errors:
+            raise ValueError("; ".join(errors))
+    
+    def run_batch(self, args) -> int:
+        """
+        Generate a dictionary from command line arguments without any prompts
+        
+        Args:
+            args: Parsed command line arguments
+        
+        Returns:
+            Process exit code (0 = success)
+        """
+        if config.REQUIRE_DISCLAIMER_ACCEPTANCE and not args.agree:
+            print(config.get_disclaimer_text())
+            print("\n❌ Batch mode requires --agree to accept the terms above.")
+            return 2
+        
+        try:
+            cfg = self.build_batch_config(args)
+        except (OSError, ValueError) as e:
+            print(f"❌ Invalid batch configuration: {e}")
+            return 2
+        
+        return 0 if self.run_dictionary_generation(cfg) else 1
     
     def load_config_file(self):
         """Load configuration from JSON file"""
@@ -275,8 +437,10 @@ Select an option (0-12): """
         filepath = input("Enter config file path: ").strip()
         
         try:
-            with open(filepath, 'r') as f:
-                self.config_data = json.load(f)
+            # One binary read; json.loads detects the UTF encoding of bytes
+            # itself, so the text I/O layer is skipped
+            with open(filepath, 'rb') as f:
+                self.config_data = json.loads(f.read())
             print(f"✓ Configuration loaded from {filepath}")
             self.show_current_config()
         except FileNotFoundError:
@@ -292,11 +456,14 @@ Select an option (0-12): """
             print("\n❌ No configuration loaded")
             return
         
-        print("\n" + "="*60)
-        print("CURRENT CONFIGURATION")
-        print("="*60)
-        print(json.dumps(self.config_data, indent=2))
-        print("="*60)
+        # json.dumps only uses its C encoder without indent, so the indented
+        # text is built by the pure-Python encoder; emit it together with the
+        # frame in a single write
+        separator = "=" * 60
+        sys.stdout.write(
+            f"\n{separator}\nCURRENT CONFIGURATION\n{separator}\n"
+            f"{json.dumps(self.config_data, indent=2)}\n{separator}\n"
+        )
     
     def show_sample_files(self):
         """Show available sample files"""
@@ -304,17 +471,19 @@ Select an option (0-12): """
         print("SAMPLE FILES")
         print("="*60)
         
-        samples_dir = config.SAMPLES_DIR
-        if samples_dir.exists():
-            files = list(samples_dir.glob('*'))
+        # os.scandir lists the directory in one pass without building a
+        # Path object per entry or checking that the directory exists first
+        try:
+            with os.scandir(config.SAMPLES_DIR) as it:
+                files = [(entry.name, entry.stat().st_size) for entry in it]
+        except FileNotFoundError:
+            print("Samples directory not found")
+        else:
             if files:
-                for i, f in enumerate(files, 1):
-                    size = f.stat().st_size / 1024
-                    print(f"{i:2d}. {f.name} ({size:.1f} KB)")
+                for i, (name, size) in enumerate(files, 1):
+                    print(f"{i:2d}. {name} ({size / 1024:.1f} KB)")
             else:
                 print("No sample files found")
-        else:
-            print("Samples directory not found")
         
         print("="*60)
     
@@ -399,7 +568,41 @@ def main():
     parser.add_argument(
         '--config',
         type=str,
-        help='Load configuration from file'
+        help='Generate a dictionary from a JSON settings file (batch mode)'
+    )
+    
+    # Batch mode: any of these options skips the menu and all prompts
+    batch = parser.add_argument_group('batch mode')
+    batch.add_argument(
+        '--base-words',
+        type=str,
+        help='Comma-separated base words (e.g. admin,acme,summer)'
+    )
+    batch.add_argument(
+        '--years',
+        type=str,
+        help='Add date patterns for a year range (e.g. 2020-2024)'
+    )
+    batch.add_argument(
+        '--mutations',
+        type=str,
+        help='Comma-separated mutations to enable: leetspeak,uppercase,numbers,special '
+             '(empty string = none)'
+    )
+    batch.add_argument(
+        '--output',
+        type=str,
+        help='Output wordlist path'
+    )
+    batch.add_argument(
+        '--max-words',
+        type=int,
+        help='Maximum words to save (0 = unlimited)'
+    )
+    batch.add_argument(
+        '--agree',
+        action='store_true',
+        help='Accept the ethical use disclaimer without prompting'
     )
     
     args = parser.parse_args()
@@ -407,6 +610,11 @@ def main():
     # Create and run application
     app = PasswordCrackingSuite()
     
+    batch_options = (args.config, args.base_words, args.years, args.mutations,
+                     args.output, args.max_words)
+    if any(option is not None for option in batch_options):
+        sys.exit(app.run_batch(args))
+    
     if args.demo:
         print("[DEMO MODE] Running with sample configuration...")
         app.print_banner()
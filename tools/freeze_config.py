@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Configuration Freeze Tool
+Pre-compiles the configuration modules to bytecode
+
+Writes the .pyc files for the configuration modules into __pycache__
+using the default timestamp invalidation, the same files Python writes
+itself on the first import (equivalent to python3 -m compileall config).
+This does not make later starts faster; it is for installs where the
+first run cannot write __pycache__ (read-only directories, other users),
+which would otherwise compile the modules on every start.
+
+Python checks the .pyc against the source timestamp on every import and
+recompiles when it changed, so edits to config/constants.py always take
+effect.
+
+Usage:
+    python3 tools/freeze_config.py          # Compile configuration modules
+    python3 tools/freeze_config.py -O 2     # Also compile for python3 -OO
+"""
+
+import argparse
+import py_compile
+import sys
+from pathlib import Path
+
+# Project root (this file lives in tools/)
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Modules read on every start of the application
+CONFIG_MODULES = ['config/constants.py', 'config/__init__.py']
+
+
+def freeze_config(optimize: int = -1) -> int:
+    """
+    Compile the configuration modules to timestamp-checked bytecode
+    
+    Args:
+        optimize: Optimization level passed to py_compile (-1 = current
+                  interpreter, 1 = -O, 2 = -OO)
+    
+    Returns:
+        Number of modules that failed to compile
+    """
+    failures = 0
+    
+    for name in CONFIG_MODULES:
+        source = BASE_DIR / name
+        try:
+            cfile = py_compile.compile(
+                str(source),
+                doraise=True,
+                optimize=optimize,
+                invalidation_mode=py_compile.PycInvalidationMode.TIMESTAMP
+            )
+            print(f"[✓] {name} -> {Path(cfile).relative_to(BASE_DIR)}")
+        except py_compile.PyCompileError as e:
+            print(f"[-] Failed to compile {name}: {e.msg}")
+            failures += 1
+    
+    return failures
+
+
+def main():
+    """Entry point with argument parsing"""
+    parser = argparse.ArgumentParser(
+        description='Pre-compile the configuration modules to bytecode'
+    )
+    parser.add_argument(
+        '-O', '--optimize',
+        type=int,
+        choices=[-1, 0, 1, 2],
+        default=-1,
+        help='Optimization level (default: same as this interpreter)'
+    )
+    args = parser.parse_args()
+    
+    sys.exit(1 if freeze_config(args.optimize) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Batch Mode Smoke Check
+Runs main.py in batch mode and checks its exit codes
+
+Each case starts main.py in a subprocess with a set of command line
+options and compares the exit code with the expected one:
+0 = wordlist generated, 1 = generation failed, 2 = rejected options
+(disclaimer not accepted, invalid settings).
+
+Usage:
+    python3 tools/smoke_batch.py
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Project root (this file lives in tools/)
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Seconds a single main.py run may take
+RUN_TIMEOUT = 120
+
+
+def run_main(*options: str) -> int:
+    """
+    Run main.py with the given options
+
+    Returns:
+        Exit code of the process
+    """
+    result = subprocess.run(
+        [sys.executable, str(BASE_DIR / 'main.py'), *options],
+        cwd=BASE_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        timeout=RUN_TIMEOUT
+    )
+    return result.returncode
+
+
+def smoke_batch() -> int:
+    """
+    Run every batch mode case
+
+    Returns:
+        Number of failed cases
+    """
+    failures = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        output = str(tmp / 'wordlist.txt')
+
+        array_config = tmp / 'array.json'
+        array_config.write_text(json.dumps(['admin']))
+        string_words_config = tmp / 'string_words.json'
+        string_words_config.write_text(json.dumps({'base_words': 'admin'}))
+        good_config = tmp / 'good.json'
+        good_config.write_text(json.dumps({'base_words': ['acme'], 'max_words': 50}))
+
+        # (description, options, expected exit code)
+        cases = (
+            ('generate', ('--agree', '--base-words', 'acme', '--max-words', '50',
+                          '--output', output), 0),
+            ('generate from settings file', ('--agree', '--config', str(good_config),
+                                             '--output', output), 0),
+            ('no mutations', ('--agree', '--mutations', '', '--output', output), 0),
+            ('output is a directory', ('--agree', '--output', str(tmp)), 1),
+            ('disclaimer not accepted', ('--base-words', 'acme', '--output', output), 2),
+            ('unknown mutation', ('--agree', '--mutations', 'leet,case', '--output', output), 2),
+            ('negative max words', ('--agree', '--max-words', '-5', '--output', output), 2),
+            ('reversed years', ('--agree', '--years', '2024-2020', '--output', output), 2),
+            ('invalid years', ('--agree', '--years', 'abc', '--output', output), 2),
+            ('settings file is an array', ('--agree', '--config', str(array_config)), 2),
+            ('base_words is a string', ('--agree', '--config', str(string_words_config)), 2),
+        )
+
+        for description, options, expected in cases:
+            code = run_main(*options)
+            if code == expected:
+                print(f"[✓] {description}: exit {code}")
+            else:
+                print(f"[-] {description}: exit {code}, expected {expected}")
+                failures += 1
+
+    return failures
+
+
+def main():
+    """Entry point"""
+    sys.exit(1 if smoke_batch() else 0)
+
+
+if __name__ == "__main__":
+    main()